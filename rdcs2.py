@@ -33,38 +33,244 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import io
 import json
 import os
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from types import MappingProxyType
 import logging
 from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
 from enum import Enum
 import yaml
-import requests
 import aiohttp
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache, TTLCache
+from cachetools.keys import hashkey
 from pathlib import Path
-import time
+import random
+from email.utils import parsedate_to_datetime
+from math import radians, cos, sin, asin, sqrt
+from itertools import combinations
+from functools import lru_cache, partial, singledispatch
 
-# Scientific analysis imports
-from gwpy.timeseries import TimeSeries
-from gwpy.time import to_gps
+# Scientific analysis imports. gwpy, h5py and scipy.signal are slow to import
+# and only needed for GWOSC fetches, the disk cache and strain correlation,
+# so they are imported where they're used.
 from astropy.time import Time
 from astropy.coordinates import get_body, EarthLocation
 from astropy import units as u
-from scipy import signal, stats
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-import h5py
 
-# Visualization
-import matplotlib.pyplot as plt
-import seaborn as sns
+# Optional fast JSON codec; the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional JIT compilation of the numeric kernels; NumPy versions are used without it
+try:
+    from numba import vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Column dtypes for the struct-of-arrays tables returned by the fetchers
+SEISMIC_COLUMNS = {
+    'detector_region': 'object',
+    'magnitude': 'float64',
+    'time': 'int64',          # milliseconds since the Unix epoch (USGS)
+    'place': 'object',
+    'depth': 'float64',
+    'longitude': 'float64',
+    'latitude': 'float64',
+    'distance_km': 'float64',
+}
+TIDE_COLUMNS = {
+    'time': 'datetime64[ns]',
+    'water_level': 'float32',
+    'quality': 'object',
+}
+
+EARTH_RADIUS_KM = 6371.0
+
+# Seismic events closer than this to the GW event are reported as correlated
+GW_SEISMIC_WINDOW_SECONDS = 3600
+
+# Largest physical arrival-time offset between detectors (H1-V1 light travel
+# time is ~27 ms); inter-detector strain correlations are searched within it
+MAX_DETECTOR_LAG_SECONDS = 0.03
+
+# Bodies closer together than this on the sky count as a tight alignment
+TIGHT_ALIGNMENT_DEG = 30.0
+
+# Transient HTTP failures are retried with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_FETCH_ATTEMPTS = 5
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+
+class _TitleCache(dict):
+    """Display titles for snake_case identifiers, computed once per name."""
+    
+    def __missing__(self, name: str) -> str:
+        title = self[name] = name.replace('_', ' ').title()
+        return title
+
+
+# Report titles for data sources, correlation types and significance metrics
+TITLE = _TitleCache()
+
+SESSION_BANNER = """
+        ╔════════════════════════════════════════════════════════════════╗
+        ║           REAL MULTI-SOURCE COSMIC CORRELATION SYSTEM          ║
+        ║                                                                ║
+        ║    Analyzing REAL data from multiple scientific sources        ║
+        ╚════════════════════════════════════════════════════════════════╝
+        """
+
+
+@lru_cache(maxsize=64)
+def _sources_block(sources: Tuple[str, ...]) -> str:
+    """Report section listing the data sources used, one per line."""
+    return "\n".join(["REAL DATA SOURCES ANALYZED:", *(f"  ✓ {TITLE[source]}" for source in sources)])
+
+
+def _gw_seismic_pairs(gw_ns: np.ndarray, seismic_ns: np.ndarray,
+                      threshold_ns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find detector/seismic-event pairs closer in time than `threshold_ns`.
+
+    Returns (rows, cols, dt_seconds, confidence) for the surviving pairs in
+    row-major order, where confidence falls linearly from 1 at dt = 0 to 0
+    at the threshold.
+    """
+    diff = np.abs(gw_ns[:, None] - seismic_ns[None, :])
+    rows, cols = np.nonzero(diff < threshold_ns)
+    dt = diff[rows, cols] / 1e9
+    return rows, cols, dt, 1.0 - dt / (threshold_ns / 1e9)
+
+
+def _ang_sep(ra1, dec1, ra2, dec2):
+    """
+    Angular separation in degrees between points given in radians (broadcasts).
+
+    Uses the Vincenty arctan2 form, which stays accurate for nearly coincident
+    and nearly antipodal points where arccos of the dot product does not.
+    """
+    sin_dec1, cos_dec1 = np.sin(dec1), np.cos(dec1)
+    sin_dec2, cos_dec2 = np.sin(dec2), np.cos(dec2)
+    sin_dra, cos_dra = np.sin(ra2 - ra1), np.cos(ra2 - ra1)
+    
+    num = np.hypot(cos_dec2 * sin_dra, cos_dec1 * sin_dec2 - sin_dec1 * cos_dec2 * cos_dra)
+    den = sin_dec1 * sin_dec2 + cos_dec1 * cos_dec2 * cos_dra
+    return np.degrees(np.arctan2(num, den))
+
+
+def _pairwise_sep_upper(ra: np.ndarray, dec: np.ndarray) -> np.ndarray:
+    """
+    Angular separations in degrees between every pair of bodies.
+
+    `ra` and `dec` are in radians; pairs are returned in the row-major order
+    of the strict upper triangle (i < j), as np.triu_indices yields them.
+    """
+    # Only the N(N-1)/2 distinct pairs are evaluated; no NxN temporaries
+    i, j = np.triu_indices(len(ra), 1)
+    return _ang_sep(ra[i], dec[i], ra[j], dec[j])
+
+
+if NUMBA_AVAILABLE:
+    # Compiled on first call rather than at import; the same definition
+    # above serves as the NumPy version without numba
+    _ang_sep = vectorize(fastmath=True, cache=True)(_ang_sep)
+
+
+@singledispatch
+def _json_safe_value(obj):
+    """Convert a single non-container value to a JSON-safe equivalent."""
+    if hasattr(obj, 'value'):  # Other objects exposing a numeric .value
+        return float(obj.value)
+    return obj
+
+
+@_json_safe_value.register(np.ndarray)
+def _(obj):
+    return obj.tolist()
+
+
+@_json_safe_value.register(u.Quantity)
+def _(obj):
+    # Quantity subclasses ndarray but refuses tolist(); use its plain values
+    return obj.value.tolist()
+
+
+@_json_safe_value.register(np.integer)
+@_json_safe_value.register(np.floating)
+def _(obj):
+    return float(obj)
+
+
+def _freeze(obj):
+    """Read-only view of parsed YAML: mappings become proxies, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def load_config(config_path: str = "real_data_config.yaml") -> Mapping[str, Any]:
+    """
+    Load configuration for real data sources.
+
+    The file is parsed once per path and the result is shared by every
+    analyzer using it, so it is frozen at every level: nested mappings are
+    read-only proxies and lists become tuples. A default config is written if
+    none exists yet.
+    """
+    if os.path.exists(config_path):
+        with open(config_path, 'r') as f:
+            return _freeze(yaml.safe_load(f))
+    
+    config = {
+        'api_keys': {
+            'noaa_token': None,  # Register at https://www.ncdc.noaa.gov/cdo-web/token
+            'nasa_key': None,   # Register at https://api.nasa.gov/
+        },
+        'detector_locations': {
+            'H1': {'lat': 46.4547, 'lon': -119.4077, 'name': 'LIGO Hanford'},
+            'L1': {'lat': 30.5629, 'lon': -90.7742, 'name': 'LIGO Livingston'},
+            'V1': {'lat': 43.6314, 'lon': 10.5045, 'name': 'Virgo'}
+        },
+        'tide_stations': {
+            'west_coast': '9414290',    # San Francisco
+            'east_coast': '8638610',    # Chesapeake Bay
+            'gulf_coast': '8761724'     # Naples, FL
+        },
+        'cosmic_ray_stations': {
+            'oulu': 'OULU',
+            'moscow': 'MOSC',
+            'thule': 'THUL'
+        },
+        'analysis_window_hours': 24,
+        'correlation_threshold': 0.3,
+        'cache_duration_hours': 6,
+        'cache_max_entries': 64
+    }
+    
+    # Exclusive create: never overwrite a config another process just wrote
+    try:
+        with open(config_path, 'x') as f:
+            yaml.dump(config, f, sort_keys=False)
+    except FileExistsError:
+        pass
+    return _freeze(config)
+
 
 @dataclass
 class RealDataSource:
@@ -73,8 +279,20 @@ class RealDataSource:
     api_url: str
     api_key: Optional[str] = None
     rate_limit: float = 1.0  # seconds between requests
+    max_concurrent: int = 4  # simultaneous in-flight requests
     enabled: bool = True
-    last_request: float = 0.0
+    limiter: Optional[AsyncLimiter] = field(default=None, repr=False)
+    semaphore: Optional[asyncio.Semaphore] = field(default=None, repr=False)
+    # Time-sorted readings per feed endpoint, reused for the rest of the session
+    sorted_feeds: Dict[str, Tuple[np.ndarray, List[Dict]]] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class PlanetaryPositions:
+    """Sky positions of a set of bodies, one array entry per body"""
+    names: List[str]
+    ra_deg: np.ndarray
+    dec_deg: np.ndarray
 
 
 class RealMultiSourceAnalyzer:
@@ -82,9 +300,23 @@ class RealMultiSourceAnalyzer:
     Multi-source analyzer using real data from various APIs and sources.
     """
     
-    def __init__(self, config_path: str = "real_data_config.yaml"):
-        self.config = self.load_config(config_path)
-        self.data_cache = {}
+    # Alignment metrics shared across analyzers; the geometry for a given set
+    # of body positions never changes, so repeated events skip the pairwise trig
+    _alignment_cache = TTLCache(maxsize=128, ttl=3600)
+    
+    def __init__(self, config_path: str = "real_data_config.yaml",
+                 cache_path: str = "rdcs_cache.h5",
+                 table_cache_dir: str = "cache"):
+        self.config = load_config(config_path)
+        
+        # In-memory cache, bounded so long batch runs don't grow without limit;
+        # evicted entries are reloaded from the on-disk caches below
+        self.data_cache = LRUCache(maxsize=self.config.get('cache_max_entries', 64))
+        
+        # On-disk caches that survive process exit: dense strain series go to
+        # HDF5, tabular source data to Parquet files
+        self.cache_path = cache_path
+        self.table_cache_dir = Path(table_cache_dir)
         self.correlation_history = []
         
         # Real data sources configuration
@@ -128,57 +360,66 @@ class RealMultiSourceAnalyzer:
         
         # Initialize session for HTTP requests
         self.session = None
+        self._connector = None
+        
+        # Observer for lunar positions (Royal Observatory Greenwich). Built from
+        # fixed coordinates: EarthLocation.of_site goes through the astropy
+        # site registry, which is slow and needs network access
+        self._greenwich = EarthLocation.from_geodetic(
+            lon=-0.001475 * u.deg, lat=51.477811 * u.deg, height=46 * u.m
+        )
         
-    def load_config(self, config_path: str) -> Dict:
-        """Load configuration for real data sources."""
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-        else:
-            config = {
-                'api_keys': {
-                    'noaa_token': None,  # Register at https://www.ncdc.noaa.gov/cdo-web/token
-                    'nasa_key': None,   # Register at https://api.nasa.gov/
-                },
-                'detector_locations': {
-                    'H1': {'lat': 46.4547, 'lon': -119.4077, 'name': 'LIGO Hanford'},
-                    'L1': {'lat': 30.5629, 'lon': -90.7742, 'name': 'LIGO Livingston'},
-                    'V1': {'lat': 43.6314, 'lon': 10.5045, 'name': 'Virgo'}
-                },
-                'tide_stations': {
-                    'west_coast': '9414290',    # San Francisco
-                    'east_coast': '8638610',    # Chesapeake Bay
-                    'gulf_coast': '8761724'     # Naples, FL
-                },
-                'cosmic_ray_stations': {
-                    'oulu': 'OULU',
-                    'moscow': 'MOSC',
-                    'thule': 'THUL'
-                },
-                'analysis_window_hours': 24,
-                'correlation_threshold': 0.3,
-                'cache_duration_hours': 6
-            }
-            
-            with open(config_path, 'w') as f:
-                yaml.dump(config, f)
-            return config
-    
     async def initialize_session(self):
-        """Initialize HTTP session for API requests."""
+        """Initialize HTTP session for API requests.
+
+        The session and its pooled connector are created once and shared by
+        every fetch, so keep-alive connections and cached DNS lookups are
+        reused across sources hitting the same host.
+        """
+        if self.session is not None:
+            return
+        
+        # Per-host concurrency is bounded by each source's rate limiter, so the
+        # pool itself only needs to be large enough never to be the bottleneck
+        self._connector = aiohttp.TCPConnector(
+            limit=1024,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=60
+        )
         self.session = aiohttp.ClientSession(
+            connector=self._connector,
             timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'CosmicCorrelationAnalyzer/1.0'}
+            json_serialize=(lambda obj: orjson.dumps(obj).decode()) if orjson is not None else json.dumps,
+            headers={
+                'User-Agent': 'CosmicCorrelationAnalyzer/1.0',
+                'Connection': 'keep-alive'
+            }
         )
         logger.info("HTTP session initialized for real data fetching")
     
     async def cleanup_session(self):
         """Cleanup HTTP session."""
         if self.session:
+            # Closing the session also closes the connector it owns
             await self.session.close()
+            self.session = None
+            self._connector = None
+        
+        # Limiters and semaphores are tied to the event loop that used them
+        for source in self.data_sources.values():
+            source.limiter = None
+            source.semaphore = None
+            # Feeds are live; fetch them afresh next session
+            source.sorted_feeds.clear()
     
-    async def fetch_real_gravitational_wave_data(self, event_name: str) -> Dict[str, TimeSeries]:
-        """Fetch real GW data from GWOSC."""
+    async def fetch_real_gravitational_wave_data(self, event_name: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch real GW data from GWOSC.
+
+        Returns, per detector, a dict with the strain as a contiguous float32
+        array ('strain') plus its 'sample_rate' (Hz) and GPS start 't0'.
+        """
         if event_name not in self.gw_events:
             logger.error(f"Unknown GW event: {event_name}")
             return {}
@@ -189,29 +430,62 @@ class RealMultiSourceAnalyzer:
         
         detectors = ['H1', 'L1', 'V1']
         gw_data = {}
+        to_fetch = []
         
         for detector in detectors:
+            logger.info(f"Fetching real {detector} data for {event_name}...")
+            
+            # Check cache first
+            cache_key = f"gw_{event_name}_{detector}"
+            if cache_key in self.data_cache:
+                gw_data[detector] = self.data_cache[cache_key]
+                logger.info(f"✅ Loaded {detector} from cache")
+                continue
+            
+            strain_record = self._read_strain(f"gw/{event_name}/{detector}")
+            if strain_record is not None:
+                gw_data[detector] = strain_record
+                self.data_cache[cache_key] = strain_record
+                logger.info(f"✅ Loaded {detector} from {self.cache_path}")
+                continue
+            
+            to_fetch.append(detector)
+        
+        if not to_fetch:
+            return gw_data
+        
+        # Fetch from GWOSC. fetch_open_data blocks, so the detectors are
+        # downloaded concurrently in worker threads to keep the loop free.
+        from gwpy.timeseries import TimeSeries
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, partial(
+                TimeSeries.fetch_open_data,
+                detector,
+                gps_time - duration//2,
+                gps_time + duration//2,
+                cache=True
+            )) for detector in to_fetch),
+            return_exceptions=True
+        )
+        
+        for detector, strain_data in zip(to_fetch, results):
             try:
-                logger.info(f"Fetching real {detector} data for {event_name}...")
-                
-                # Check cache first
-                cache_key = f"gw_{event_name}_{detector}"
-                if cache_key in self.data_cache:
-                    gw_data[detector] = self.data_cache[cache_key]
-                    logger.info(f"✅ Loaded {detector} from cache")
-                    continue
-                
-                # Fetch from GWOSC
-                strain_data = TimeSeries.fetch_open_data(
-                    detector,
-                    gps_time - duration//2,
-                    gps_time + duration//2,
-                    cache=True
-                )
+                if isinstance(strain_data, BaseException):
+                    raise strain_data
                 
                 if strain_data is not None:
-                    gw_data[detector] = strain_data
-                    self.data_cache[cache_key] = strain_data
+                    # Keep only the raw samples; the TimeSeries wrapper isn't
+                    # needed downstream and float32 halves the footprint
+                    strain_record = {
+                        'strain': np.ascontiguousarray(strain_data.value, dtype=np.float32),
+                        'sample_rate': float(strain_data.sample_rate.value),
+                        't0': float(strain_data.t0.value)
+                    }
+                    gw_data[detector] = strain_record
+                    self.data_cache[f"gw_{event_name}_{detector}"] = strain_record
+                    
+                    self._write_strain(f"gw/{event_name}/{detector}", strain_record)
                     logger.info(f"✅ Fetched real {detector} data: {len(strain_data)} samples at {strain_data.sample_rate}")
                 else:
                     logger.warning(f"❌ No {detector} data available for {event_name}")
@@ -219,22 +493,29 @@ class RealMultiSourceAnalyzer:
             except Exception as e:
                 logger.error(f"Error fetching {detector} data for {event_name}: {e}")
         
-        return gw_data
+        # Preserve the H1, L1, V1 ordering regardless of where each came from
+        return {det: gw_data[det] for det in detectors if det in gw_data}
     
-    async def fetch_real_seismic_data(self, event_time: datetime, radius_km: int = 1000) -> List[Dict]:
-        """Fetch real seismic data from USGS around GW event time."""
+    async def fetch_real_seismic_data(self, event_time: datetime, radius_km: int = 1000) -> pd.DataFrame:
+        """Fetch real seismic data from USGS around GW event time.
+
+        Returns one row per seismic event, with columns as in SEISMIC_COLUMNS.
+        """
         source = self.data_sources['usgs_earthquake']
         if not source.enabled:
-            return []
+            return self._empty_table(SEISMIC_COLUMNS)
         
-        # Rate limiting
-        await self._rate_limit(source)
+        table_name = f"seismic_{event_time.strftime('%Y%m%dT%H%M%S')}_r{radius_km}"
+        cached = self._read_table(table_name)
+        if cached is not None:
+            logger.info(f"✅ Loaded {len(cached)} seismic events from {self.table_cache_dir}")
+            return cached.astype(SEISMIC_COLUMNS)
         
         # Time window around event
         start_time = event_time - timedelta(hours=1)
         end_time = event_time + timedelta(hours=1)
         
-        params = {
+        base_params = {
             'format': 'geojson',
             'starttime': start_time.strftime('%Y-%m-%dT%H:%M:%S'),
             'endtime': end_time.strftime('%Y-%m-%dT%H:%M:%S'),
@@ -242,103 +523,130 @@ class RealMultiSourceAnalyzer:
             'maxradius': radius_km / 111.32  # Convert km to degrees
         }
         
-        # Add detector locations for proximity search
-        detector_locations = []
-        for detector, loc in self.config['detector_locations'].items():
-            detector_locations.append((loc['lat'], loc['lon'], detector))
-        
-        all_seismic_data = []
+        async def _fetch_one(lat: float, lon: float, detector_name: str,
+                             params: Dict) -> Optional[pd.DataFrame]:
+            logger.info(f"Fetching real seismic data near {detector_name}...")
+            
+            data = await self._fetch_json(source, source.api_url, params=params)
+            features = data.get('features', [])
+            logger.info(f"✅ Found {len(features)} seismic events near {detector_name}")
+            
+            if not features:
+                return None
+            
+            props = [feature['properties'] for feature in features]
+            coords = np.array(
+                [feature['geometry']['coordinates'][:2] for feature in features],
+                dtype=np.float64
+            )
+            lons, lats = coords[:, 0], coords[:, 1]
+            
+            # Distance from the detector to every event at once
+            distance_km = self._calculate_distance_vec(lat, lon, lats, lons)
+            
+            return pd.DataFrame({
+                'detector_region': detector_name,
+                'magnitude': [p.get('mag') for p in props],
+                'time': [p.get('time') for p in props],
+                'place': [p.get('place') for p in props],
+                'depth': [p.get('depth') for p in props],
+                'longitude': lons,
+                'latitude': lats,
+                'distance_km': distance_km
+            })
+        
+        # One query per detector location; each task owns its params dict
+        tasks = [
+            _fetch_one(loc['lat'], loc['lon'], detector,
+                       {**base_params, 'latitude': loc['lat'], 'longitude': loc['lon']})
+            for detector, loc in self.config['detector_locations'].items()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        tables = []
+        complete = True
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching seismic data: {result}")
+                complete = False
+            elif result is not None:
+                tables.append(result)
+        
+        if tables:
+            seismic_table = pd.concat(tables, ignore_index=True).astype(SEISMIC_COLUMNS)
+        else:
+            seismic_table = self._empty_table(SEISMIC_COLUMNS)
         
-        for lat, lon, detector_name in detector_locations:
-            try:
-                params.update({'latitude': lat, 'longitude': lon})
-                
-                logger.info(f"Fetching real seismic data near {detector_name}...")
-                
-                async with self.session.get(source.api_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if 'features' in data:
-                            for feature in data['features']:
-                                props = feature['properties']
-                                coords = feature['geometry']['coordinates']
-                                
-                                seismic_event = {
-                                    'detector_region': detector_name,
-                                    'magnitude': props.get('mag'),
-                                    'time': props.get('time'),
-                                    'place': props.get('place'),
-                                    'depth': props.get('depth'),
-                                    'longitude': coords[0],
-                                    'latitude': coords[1],
-                                    'distance_km': self._calculate_distance(
-                                        lat, lon, coords[1], coords[0]
-                                    )
-                                }
-                                all_seismic_data.append(seismic_event)
-                                
-                        logger.info(f"✅ Found {len(data.get('features', []))} seismic events near {detector_name}")
-                    else:
-                        logger.warning(f"USGS API error: {response.status}")
-                        
-            except Exception as e:
-                logger.error(f"Error fetching seismic data: {e}")
+        # Don't persist partial results, or failed queries would never be retried
+        if complete:
+            self._write_table(table_name, seismic_table)
         
-        return all_seismic_data
+        return seismic_table
     
-    async def fetch_real_tide_data(self, event_time: datetime) -> Dict[str, List[Dict]]:
-        """Fetch real ocean tide data from NOAA."""
+    async def fetch_real_tide_data(self, event_time: datetime) -> Dict[str, pd.DataFrame]:
+        """Fetch real ocean tide data from NOAA.
+
+        Returns one table per station, with columns as in TIDE_COLUMNS.
+        """
         source = self.data_sources['noaa_tides']
         if not source.enabled:
             return {}
         
-        # Rate limiting
-        await self._rate_limit(source)
-        
-        tide_data = {}
-        
         # Time window for tide data
         start_time = event_time - timedelta(hours=12)
         end_time = event_time + timedelta(hours=12)
         
-        for region, station_id in self.config['tide_stations'].items():
-            try:
-                logger.info(f"Fetching real tide data for {region} (Station {station_id})...")
-                
-                params = {
-                    'begin_date': start_time.strftime('%Y%m%d %H:%M'),
-                    'end_date': end_time.strftime('%Y%m%d %H:%M'),
-                    'station': station_id,
-                    'product': 'water_level',
-                    'datum': 'MLLW',
-                    'time_zone': 'gmt',
-                    'units': 'metric',
-                    'format': 'json'
-                }
+        stamp = event_time.strftime('%Y%m%dT%H%M%S')
+        
+        async def _fetch_one(region: str, station_id: str) -> Optional[pd.DataFrame]:
+            table_name = f"tides_{stamp}_{station_id}"
+            cached = self._read_table(table_name)
+            if cached is not None:
+                logger.info(f"✅ Loaded {len(cached)} tide readings for {region} from {self.table_cache_dir}")
+                return cached.astype(TIDE_COLUMNS)
+            
+            logger.info(f"Fetching real tide data for {region} (Station {station_id})...")
+            
+            params = {
+                'begin_date': start_time.strftime('%Y%m%d %H:%M'),
+                'end_date': end_time.strftime('%Y%m%d %H:%M'),
+                'station': station_id,
+                'product': 'water_level',
+                'datum': 'MLLW',
+                'time_zone': 'gmt',
+                'units': 'metric',
+                'format': 'json'
+            }
+            
+            data = await self._fetch_json(source, source.api_url, params=params)
+            
+            if 'data' in data and data['data']:
+                readings = data['data']
+                tide_readings = pd.DataFrame({
+                    'time': [r['t'] for r in readings],
+                    'water_level': [r['v'] for r in readings],
+                    'quality': [r.get('q', 'v') for r in readings]
+                }).astype(TIDE_COLUMNS)
                 
-                async with self.session.get(source.api_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if 'data' in data and data['data']:
-                            tide_readings = []
-                            for reading in data['data']:
-                                tide_readings.append({
-                                    'time': reading['t'],
-                                    'water_level': float(reading['v']),
-                                    'quality': reading.get('q', 'v')
-                                })
-                            
-                            tide_data[region] = tide_readings
-                            logger.info(f"✅ Fetched {len(tide_readings)} tide readings for {region}")
-                        else:
-                            logger.warning(f"No tide data available for {region}")
-                    else:
-                        logger.warning(f"NOAA Tides API error for {region}: {response.status}")
-                        
-            except Exception as e:
-                logger.error(f"Error fetching tide data for {region}: {e}")
+                self._write_table(table_name, tide_readings)
+                logger.info(f"✅ Fetched {len(tide_readings)} tide readings for {region}")
+                return tide_readings
+            else:
+                logger.warning(f"No tide data available for {region}")
+            return None
+        
+        stations = list(self.config['tide_stations'].items())
+        results = await asyncio.gather(
+            *(_fetch_one(region, station_id) for region, station_id in stations),
+            return_exceptions=True
+        )
+        
+        tide_data = {}
+        for (region, _), result in zip(stations, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching tide data for {region}: {result}")
+            elif result is not None:
+                tide_data[region] = result
         
         return tide_data
     
@@ -348,66 +656,57 @@ class RealMultiSourceAnalyzer:
         if not source.enabled:
             return {}
         
-        # Rate limiting
-        await self._rate_limit(source)
+        logger.info("Fetching real space weather data...")
         
-        space_weather = {}
+        # Fetch various space weather products
+        endpoints = {
+            'solar_wind': 'rtsw/rtsw_mag_1m.json',
+            'proton_flux': 'goes/goes-proton-flux.json',
+            'xray_flux': 'goes/goes-xray-flux.json',
+            'kp_index': 'planetary_k_index/kp_index.json'
+        }
         
-        try:
-            logger.info("Fetching real space weather data...")
-            
-            # Fetch various space weather products
-            endpoints = {
-                'solar_wind': 'rtsw/rtsw_mag_1m.json',
-                'proton_flux': 'goes/goes-proton-flux.json',
-                'xray_flux': 'goes/goes-xray-flux.json',
-                'kp_index': 'planetary_k_index/kp_index.json'
-            }
+        async def _fetch_one(data_type: str, endpoint: str) -> List[Dict]:
+            # Each feed is fetched and time-sorted once per session; later
+            # events only need the window lookup
+            feed = source.sorted_feeds.get(endpoint)
+            if feed is None:
+                data = await self._fetch_json(source, f"{source.api_url}/{endpoint}")
+                feed = source.sorted_feeds[endpoint] = self._sort_space_weather(data)
             
-            for data_type, endpoint in endpoints.items():
-                try:
-                    url = f"{source.api_url}/{endpoint}"
-                    
-                    async with self.session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Filter data around event time
-                            filtered_data = self._filter_space_weather_by_time(
-                                data, event_time, hours_window=6
-                            )
-                            
-                            if filtered_data:
-                                space_weather[data_type] = filtered_data
-                                logger.info(f"✅ Fetched {len(filtered_data)} {data_type} readings")
-                        else:
-                            logger.warning(f"Space weather API error for {data_type}: {response.status}")
-                            
-                except Exception as e:
-                    logger.error(f"Error fetching {data_type}: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error in space weather data fetch: {e}")
+            # Filter data around event time
+            return self._select_time_window(*feed, event_time, hours_window=6)
+        
+        results = await asyncio.gather(
+            *(_fetch_one(data_type, endpoint) for data_type, endpoint in endpoints.items()),
+            return_exceptions=True
+        )
+        
+        space_weather = {}
+        for data_type, result in zip(endpoints, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching {data_type}: {result}")
+            elif result:
+                space_weather[data_type] = result
+                logger.info(f"✅ Fetched {len(result)} {data_type} readings")
         
         return space_weather
     
-    async def fetch_real_cosmic_ray_data(self, event_time: datetime) -> Dict[str, List[Dict]]:
-        """Fetch real cosmic ray data from neutron monitors."""
+    async def fetch_real_cosmic_ray_data(self, event_time: datetime) -> Dict[str, pd.DataFrame]:
+        """Fetch real cosmic ray data from neutron monitors.
+
+        Returns one table per station with time, count_rate and station columns.
+        """
         source = self.data_sources['cosmic_ray_data']
         if not source.enabled:
             return {}
         
-        # Rate limiting
-        await self._rate_limit(source)
-        
-        cosmic_ray_data = {}
-        
         # Time window
         start_time = event_time - timedelta(hours=6)
         end_time = event_time + timedelta(hours=6)
         
-        for station_name, station_code in self.config['cosmic_ray_stations'].items():
-            try:
+        async def _fetch_one(station_name: str, station_code: str) -> pd.DataFrame:
+            async with self._rate_limit(source):
                 logger.info(f"Fetching real cosmic ray data from {station_name}...")
                 
                 # NMDB API parameters
@@ -422,39 +721,50 @@ class RealMultiSourceAnalyzer:
                 # Note: NMDB requires specific format, this is a simplified example
                 # In practice, you'd need to implement their specific API format
                 
-                try:
-                    # For now, we'll create realistic synthetic data based on typical cosmic ray patterns
-                    # In production, implement actual NMDB API calls
-                    
-                    hours = int((end_time - start_time).total_seconds() / 3600)
-                    base_rate = 6000  # Typical neutron count rate
-                    
-                    cr_readings = []
-                    for i in range(hours):
-                        time_point = start_time + timedelta(hours=i)
-                        
-                        # Add realistic variations
-                        rate = base_rate + np.random.normal(0, 200) + 500 * np.sin(2 * np.pi * i / 24)
-                        
-                        cr_readings.append({
-                            'time': time_point.isoformat(),
-                            'count_rate': max(0, rate),
-                            'station': station_name
-                        })
-                    
-                    cosmic_ray_data[station_name] = cr_readings
-                    logger.info(f"✅ Fetched {len(cr_readings)} cosmic ray readings from {station_name}")
-                    
-                except Exception as e:
-                    logger.warning(f"Cosmic ray data fetch failed for {station_name}: {e}")
-                    
-            except Exception as e:
-                logger.error(f"Error setting up cosmic ray fetch for {station_name}: {e}")
+                # For now, we'll create realistic synthetic data based on typical cosmic ray patterns
+                # In production, implement actual NMDB API calls
+                
+                hours = int((end_time - start_time).total_seconds() / 3600)
+                base_rate = 6000  # Typical neutron count rate
+                
+                # Add realistic variations: noise plus a diurnal modulation
+                idx = np.arange(hours)
+                rates = np.maximum(
+                    0, base_rate + np.random.normal(0, 200, hours) + 500 * np.sin(2 * np.pi * idx / 24)
+                )
+                
+                cr_readings = pd.DataFrame({
+                    'time': np.datetime64(start_time, 's') + idx.astype('timedelta64[h]'),
+                    'count_rate': rates,
+                    'station': station_name
+                })
+                
+                logger.info(f"✅ Fetched {len(cr_readings)} cosmic ray readings from {station_name}")
+                return cr_readings
+        
+        stations = list(self.config['cosmic_ray_stations'].items())
+        results = await asyncio.gather(
+            *(_fetch_one(name, code) for name, code in stations),
+            return_exceptions=True
+        )
+        
+        cosmic_ray_data = {}
+        for (station_name, _), result in zip(stations, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Cosmic ray data fetch failed for {station_name}: {result}")
+            else:
+                cosmic_ray_data[station_name] = result
         
         return cosmic_ray_data
     
     async def fetch_real_planetary_positions(self, event_time: datetime) -> Dict:
         """Fetch real planetary positions using astropy."""
+        # Ephemerides are deterministic, so reuse results for the same minute
+        cache_key = ('planets', event_time.replace(second=0, microsecond=0).isoformat())
+        if cache_key in self.data_cache:
+            logger.info("✅ Loaded planetary positions from cache")
+            return self.data_cache[cache_key]
+        
         logger.info("Calculating real planetary positions...")
         
         try:
@@ -463,11 +773,12 @@ class RealMultiSourceAnalyzer:
             
             planets = ['mercury', 'venus', 'earth', 'mars', 'jupiter', 'saturn', 'moon']
             positions = {}
+            names, ra_deg, dec_deg = [], [], []
             
             for planet in planets:
                 try:
                     if planet == 'moon':
-                        body = get_body('moon', astro_time, location=EarthLocation.of_site('greenwich'))
+                        body = get_body('moon', astro_time, location=self._greenwich)
                     else:
                         body = get_body(planet, astro_time)
                     
@@ -477,18 +788,26 @@ class RealMultiSourceAnalyzer:
                         'distance_au': body.distance.to(u.AU).value if hasattr(body, 'distance') else None,
                         'time': event_time.isoformat()
                     }
+                    names.append(planet)
+                    ra_deg.append(positions[planet]['ra_deg'])
+                    dec_deg.append(positions[planet]['dec_deg'])
                     
                 except Exception as e:
                     logger.warning(f"Could not get position for {planet}: {e}")
             
             # Calculate alignment metrics
-            alignment_metrics = self._calculate_planetary_alignment(positions)
+            alignment_metrics = self._calculate_planetary_alignment(PlanetaryPositions(
+                names=names,
+                ra_deg=np.array(ra_deg, dtype=np.float64),
+                dec_deg=np.array(dec_deg, dtype=np.float64)
+            ))
             
             planetary_data = {
                 'positions': positions,
                 'alignment_metrics': alignment_metrics,
                 'calculation_time': event_time.isoformat()
             }
+            self.data_cache[cache_key] = planetary_data
             
             logger.info(f"✅ Calculated positions for {len(positions)} celestial bodies")
             return planetary_data
@@ -518,45 +837,59 @@ class RealMultiSourceAnalyzer:
             'significance_scores': {}
         }
         
-        # 1. Fetch real gravitational wave data
-        logger.info("📡 Fetching real gravitational wave data...")
-        gw_data = await self.fetch_real_gravitational_wave_data(event_name)
+        # 1-6. Fetch all real data sources concurrently; they are independent,
+        # so total wall time is bounded by the slowest source, not the sum.
+        logger.info("📡 Fetching gravitational wave, seismic, tide, space weather, "
+                    "cosmic ray and planetary data concurrently...")
+        # Each source with the empty value that stands in for it on failure
+        fetches = {
+            'gravitational_waves': (self.fetch_real_gravitational_wave_data(event_name), {}),
+            'seismic': (self.fetch_real_seismic_data(event_time), self._empty_table(SEISMIC_COLUMNS)),
+            'ocean_tides': (self.fetch_real_tide_data(event_time), {}),
+            'space_weather': (self.fetch_real_space_weather_data(event_time), {}),
+            'cosmic_rays': (self.fetch_real_cosmic_ray_data(event_time), {}),
+            'planetary_positions': (self.fetch_real_planetary_positions(event_time), {}),
+        }
+        results = await asyncio.gather(
+            *(coro for coro, _ in fetches.values()), return_exceptions=True
+        )
+        
+        # A failing source must not abort the whole analysis
+        fetched = {}
+        for (name, (_, empty)), result in zip(fetches.items(), results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching {name} data: {result}")
+                result = empty
+            fetched[name] = result
+        
+        gw_data = fetched['gravitational_waves']
+        seismic_data = fetched['seismic']
+        tide_data = fetched['ocean_tides']
+        space_weather_data = fetched['space_weather']
+        cosmic_ray_data = fetched['cosmic_rays']
+        planetary_data = fetched['planetary_positions']
+        
         if gw_data:
             analysis_results['data_sources_used'].append('gravitational_waves')
             analysis_results['gw_detectors'] = list(gw_data.keys())
-            analysis_results['gw_samples'] = {det: len(data) for det, data in gw_data.items()}
-        
-        # 2. Fetch real seismic data
-        logger.info("🌍 Fetching real seismic data...")
-        seismic_data = await self.fetch_real_seismic_data(event_time)
-        if seismic_data:
+            analysis_results['gw_samples'] = {det: len(data['strain']) for det, data in gw_data.items()}
+
+        if not seismic_data.empty:
             analysis_results['data_sources_used'].append('seismic')
             analysis_results['seismic_events'] = len(seismic_data)
-        
-        # 3. Fetch real tide data
-        logger.info("🌊 Fetching real tide data...")
-        tide_data = await self.fetch_real_tide_data(event_time)
+
         if tide_data:
             analysis_results['data_sources_used'].append('ocean_tides')
             analysis_results['tide_stations'] = list(tide_data.keys())
-        
-        # 4. Fetch real space weather data
-        logger.info("☀️ Fetching real space weather data...")
-        space_weather_data = await self.fetch_real_space_weather_data(event_time)
+
         if space_weather_data:
             analysis_results['data_sources_used'].append('space_weather')
             analysis_results['space_weather_types'] = list(space_weather_data.keys())
-        
-        # 5. Fetch real cosmic ray data
-        logger.info("☢️ Fetching real cosmic ray data...")
-        cosmic_ray_data = await self.fetch_real_cosmic_ray_data(event_time)
+
         if cosmic_ray_data:
             analysis_results['data_sources_used'].append('cosmic_rays')
             analysis_results['cosmic_ray_stations'] = list(cosmic_ray_data.keys())
-        
-        # 6. Calculate real planetary positions
-        logger.info("🪐 Calculating real planetary positions...")
-        planetary_data = await self.fetch_real_planetary_positions(event_time)
+
         if planetary_data:
             analysis_results['data_sources_used'].append('planetary_positions')
             analysis_results['planetary_bodies'] = list(planetary_data['positions'].keys())
@@ -592,25 +925,37 @@ class RealMultiSourceAnalyzer:
         correlations = []
         
         # 1. GW-Seismic correlations
-        if gw_data and seismic_data:
-            for detector, strain_data in gw_data.items():
-                # Check timing correlations with seismic events
-                gw_time = event_time
-                
-                for seismic_event in seismic_data:
-                    seismic_time = datetime.utcfromtimestamp(seismic_event['time'] / 1000)
-                    time_diff = abs((gw_time - seismic_time).total_seconds())
-                    
-                    if time_diff < 3600:  # Within 1 hour
-                        correlation = {
-                            'type': 'gw_seismic_timing',
-                            'gw_detector': detector,
-                            'seismic_magnitude': seismic_event['magnitude'],
-                            'time_difference_seconds': time_diff,
-                            'distance_km': seismic_event['distance_km'],
-                            'confidence': 1.0 - (time_diff / 3600)
-                        }
-                        correlations.append(correlation)
+        if gw_data and not seismic_data.empty:
+            detectors = list(gw_data)
+            
+            # Detector x seismic-event timing offsets; every detector
+            # observes the same GW event time. USGS times are epoch ms, so
+            # the column is reinterpreted as datetime64 without conversion.
+            gw_np = np.datetime64(event_time, 'ns')
+            seismic_np = seismic_data['time'].to_numpy(dtype=np.int64).view('datetime64[ms]')
+            
+            gw_times_ns = np.full(len(detectors), gw_np.astype(np.int64), dtype=np.int64)
+            seismic_times_ns = seismic_np.astype('datetime64[ns]').view(np.int64)
+            
+            rows, cols, dt, conf = _gw_seismic_pairs(
+                gw_times_ns, seismic_times_ns, GW_SEISMIC_WINDOW_SECONDS * 10**9
+            )
+            
+            magnitudes = seismic_data['magnitude'].to_numpy()
+            distances = seismic_data['distance_km'].to_numpy()
+            
+            correlations.extend(
+                {
+                    'type': 'gw_seismic_timing',
+                    'gw_detector': detectors[i],
+                    # USGS leaves some magnitudes unset; keep those null
+                    'seismic_magnitude': None if np.isnan(magnitudes[j]) else float(magnitudes[j]),
+                    'time_difference_seconds': float(dt[k]),
+                    'distance_km': float(distances[j]),
+                    'confidence': float(conf[k])
+                }
+                for k, (i, j) in enumerate(zip(rows, cols))
+            )
         
         # 2. Tide-Planetary correlations
         if tide_data and planetary_data:
@@ -642,12 +987,40 @@ class RealMultiSourceAnalyzer:
                     }
                     correlations.append(correlation)
         
-        # 4. Multi-source timing correlations
+        # 4. Inter-detector strain correlations
+        correlation_threshold = self.config.get('correlation_threshold', 0.3)
+        for det1, det2 in combinations(sorted(gw_data), 2):
+            strain1, strain2 = gw_data[det1]['strain'], gw_data[det2]['strain']
+            sample_rate = gw_data[det1]['sample_rate']
+            if len(strain1) != len(strain2) or sample_rate != gw_data[det2]['sample_rate']:
+                logger.debug(f"Skipping {det1}-{det2} cross-correlation: mismatched sampling")
+                continue
+            
+            xcorr = self._xcorr_fft(strain1, strain2)
+            
+            # Only physically allowed lags around zero are meaningful
+            zero_lag = len(xcorr) // 2
+            max_lag = int(MAX_DETECTOR_LAG_SECONDS * sample_rate)
+            window = xcorr[max(0, zero_lag - max_lag):zero_lag + max_lag + 1]
+            peak = int(np.argmax(np.abs(window)))
+            if abs(window[peak]) < correlation_threshold:
+                continue
+            
+            correlation = {
+                'type': 'inter_detector_strain_correlation',
+                'detector_pair': f"{det1}-{det2}",
+                'peak_correlation': float(window[peak]),
+                'lag_seconds': (peak - min(zero_lag, max_lag)) / sample_rate,
+                'confidence': float(abs(window[peak]))
+            }
+            correlations.append(correlation)
+        
+        # 5. Multi-source timing correlations
         if len([gw_data, seismic_data, space_weather_data, cosmic_ray_data]) >= 3:
             correlation = {
                 'type': 'multi_source_timing',
                 'event_time': event_time.isoformat(),
-                'sources_count': len([x for x in [gw_data, seismic_data, space_weather_data, cosmic_ray_data] if x]),
+                'sources_count': len([x for x in [gw_data, seismic_data, space_weather_data, cosmic_ray_data] if len(x)]),
                 'confidence': 0.8  # High confidence when multiple sources align
             }
             correlations.append(correlation)
@@ -731,208 +1104,419 @@ class RealMultiSourceAnalyzer:
         
         return insights
     
+    @asynccontextmanager
     async def _rate_limit(self, source: RealDataSource):
-        """Implement rate limiting for API requests."""
-        current_time = time.time()
-        time_since_last = current_time - source.last_request
-        
-        if time_since_last < source.rate_limit:
-            wait_time = source.rate_limit - time_since_last
-            logger.debug(f"Rate limiting {source.name}: waiting {wait_time:.1f}s")
-            await asyncio.sleep(wait_time)
+        """
+        Admit one request to a source under its rate limit.
+
+        An AsyncLimiter token bucket lets up to `source.max_concurrent`
+        requests burst together while averaging one request per
+        `source.rate_limit` seconds; the semaphore caps how many requests are
+        in flight at once.
+        """
+        # Created lazily so they belong to the running event loop
+        if source.limiter is None:
+            source.limiter = AsyncLimiter(source.max_concurrent,
+                                          source.max_concurrent * source.rate_limit)
+        if source.semaphore is None:
+            source.semaphore = asyncio.Semaphore(source.max_concurrent)
+        
+        async with source.limiter, source.semaphore:
+            yield
+    
+    def _read_strain(self, h5_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a strain record from the HDF5 cache, or None on a miss.
+
+        The file is opened only for the read, so other processes sharing the
+        cache aren't locked out; any cache error is treated as a miss.
+        """
+        if not os.path.exists(self.cache_path):
+            return None
+        try:
+            import h5py
+            with h5py.File(self.cache_path, 'r') as cache_file:
+                if h5_path not in cache_file:
+                    return None
+                dataset = cache_file[h5_path]
+                return {
+                    'strain': np.ascontiguousarray(dataset[()], dtype=np.float32),
+                    'sample_rate': float(dataset.attrs['sample_rate']),
+                    't0': float(dataset.attrs['t0'])
+                }
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not read {h5_path} from {self.cache_path}: {e}")
+            return None
+    
+    def _write_strain(self, h5_path: str, strain_record: Dict[str, Any]):
+        """Store a strain record in the HDF5 cache; failures only log a warning."""
+        try:
+            import h5py
+            with h5py.File(self.cache_path, 'a', libver='latest') as cache_file:
+                if h5_path in cache_file:
+                    del cache_file[h5_path]
+                dataset = cache_file.create_dataset(
+                    h5_path,
+                    data=strain_record['strain'],
+                    chunks=(min(65536, len(strain_record['strain'])),),
+                    compression='lzf'
+                )
+                dataset.attrs['sample_rate'] = strain_record['sample_rate']
+                dataset.attrs['t0'] = strain_record['t0']
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not cache {h5_path} in {self.cache_path}: {e}")
+    
+    def _table_cache_file(self, name: str) -> Path:
+        """Path of the Parquet file backing a cached table."""
+        return self.table_cache_dir / f"{name}.parquet"
+    
+    def _write_table(self, name: str, table: pd.DataFrame):
+        """
+        Persist a table to the Parquet cache; failures only log a warning.
+
+        The table is written to a temporary file and moved into place, so an
+        interrupted write never leaves a truncated cache file behind.
+        """
+        path = self._table_cache_file(name)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.table_cache_dir.mkdir(parents=True, exist_ok=True)
+            table.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not cache {name} in {self.table_cache_dir}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def _read_table(self, name: str) -> Optional[pd.DataFrame]:
+        """Load a table written by _write_table, or None if it isn't cached or can't be read."""
+        path = self._table_cache_file(name)
+        if not path.exists():
+            return None
+        try:
+            return pd.read_parquet(path, engine='pyarrow')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+    
+    async def _fetch_json(self, source: RealDataSource, url: str,
+                          params: Optional[Dict] = None) -> Any:
+        """
+        GET a JSON document from a source, retrying transient failures.
+
+        Responses with a status in RETRY_STATUSES are retried up to
+        MAX_FETCH_ATTEMPTS times with jittered exponential backoff, or after
+        the server's Retry-After delay when it sends one. Other errors, and
+        the last failed attempt, raise aiohttp.ClientResponseError.
+        """
+        for attempt in range(MAX_FETCH_ATTEMPTS):
+            async with self._rate_limit(source):
+                async with self.session.get(url, params=params) as response:
+                    self._apply_rate_limit_headers(source, response.headers)
+                    try:
+                        response.raise_for_status()
+                    except aiohttp.ClientResponseError as e:
+                        if e.status not in RETRY_STATUSES or attempt == MAX_FETCH_ATTEMPTS - 1:
+                            raise
+                        status = e.status
+                        delay = self._retry_delay(response.headers, attempt)
+                    else:
+                        return await self._read_json(response)
+            
+            logger.warning(f"{source.name} returned {status}; retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{MAX_FETCH_ATTEMPTS})")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _retry_delay(headers: Mapping[str, str], attempt: int) -> float:
+        """Seconds to wait before retrying, from Retry-After or exponential backoff."""
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                # HTTP-date form
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), MAX_RETRY_DELAY_SECONDS)
         
-        source.last_request = time.time()
+        return min(2 ** attempt + random.random(), MAX_RETRY_DELAY_SECONDS)
+    
+    @staticmethod
+    def _apply_rate_limit_headers(source: RealDataSource, headers: Mapping[str, str]):
+        """Slow a source down to the request rate its server advertises."""
+        limit = headers.get('X-RateLimit-Limit')
+        if limit is None:
+            return
+        try:
+            min_interval = 1.0 / float(limit)
+        except (ValueError, ZeroDivisionError):
+            return
+        
+        if min_interval > source.rate_limit:
+            logger.info(f"Tightening {source.name} rate limit to {min_interval:.2f}s per request")
+            source.rate_limit = min_interval
+            # Rebuilt with the new rate on the next request
+            source.limiter = None
+    
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body, using orjson when it is installed."""
+        raw = await response.read()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    
+    @staticmethod
+    def _xcorr_fft(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Normalized cross-correlation of two equal-length series.
+
+        Uses the FFT path (O(N log N)) rather than a direct sum. The output
+        covers every lag (mode='same'), with zero lag at index len(x) // 2.
+
+        Each series is standardized with float64 statistics first and the FFT
+        runs in float32. Raw strain is ~1e-21, so its squares would underflow
+        float32 without the rescaling.
+        """
+        x_std = x.std(dtype=np.float64)
+        y_std = y.std(dtype=np.float64)
+        if x_std == 0 or y_std == 0:
+            return np.zeros(len(x), dtype=np.float32)
+        
+        from scipy import signal
+        
+        x = ((x - x.mean(dtype=np.float64)) / x_std).astype(np.float32)
+        y = ((y - y.mean(dtype=np.float64)) / y_std).astype(np.float32)
+        return signal.correlate(x, y, mode='same', method='fft') / len(x)
+    
+    @staticmethod
+    def _empty_table(columns: Dict[str, str]) -> pd.DataFrame:
+        """Build an empty table with the given column dtypes."""
+        return pd.DataFrame(columns=list(columns)).astype(columns)
     
     def _filter_space_weather_by_time(self, data: List[Dict], 
                                     event_time: datetime, hours_window: int = 6) -> List[Dict]:
         """Filter space weather data by time window around event."""
+        return self._select_time_window(*self._sort_space_weather(data),
+                                        event_time, hours_window)
+    
+    def _sort_space_weather(self, data: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        Parse and time-order space weather readings once.
+
+        Returns naive-UTC datetime64[ns] times with the readings in the same
+        order, for repeated window lookups with _select_time_window.
+        Feeds repeat the same time_tag across sibling readings, so the
+        distinct strings are parsed in one vectorized call and mapped back.
+        """
         if not data:
-            return []
-        
-        start_time = event_time - timedelta(hours=hours_window)
-        end_time = event_time + timedelta(hours=hours_window)
+            return np.array([], dtype='datetime64[ns]'), []
         
-        filtered = []
-        for reading in data:
-            try:
-                # Parse time from various formats
-                time_str = reading.get('time_tag', reading.get('timestamp', ''))
-                if time_str:
-                    reading_time = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                    if start_time <= reading_time <= end_time:
-                        filtered.append(reading)
-            except Exception as e:
-                logger.debug(f"Error parsing space weather time: {e}")
+        tags = np.array(
+            [reading.get('time_tag', reading.get('timestamp', '')) for reading in data],
+            dtype=str
+        )
+        unique_tags, inverse = np.unique(tags, return_inverse=True)
+        
+        # SWPC timestamps are UTC, with or without an explicit suffix;
+        # malformed ones become NaT and are dropped
+        times = pd.to_datetime(
+            unique_tags, utc=True, errors='coerce', format='ISO8601', cache=False
+        )[inverse.ravel()]
+        idx = np.flatnonzero(times.notna())
+        times = times[idx].tz_convert(None).to_numpy(dtype='datetime64[ns]')
+        # Feeds are normally time-ordered; only sort when they aren't
+        if np.any(times[1:] < times[:-1]):
+            order = np.argsort(times, kind='stable')
+            idx, times = idx[order], times[order]
+        
+        return times, [data[i] for i in idx]
+    
+    @staticmethod
+    def _select_time_window(sorted_times: np.ndarray, sorted_data: List[Dict],
+                            event_time: datetime, hours_window: int) -> List[Dict]:
+        """Readings within `hours_window` hours of the event, by binary search."""
+        start_time, end_time = np.array(
+            [event_time - timedelta(hours=hours_window), event_time + timedelta(hours=hours_window)],
+            dtype='datetime64[ns]'
+        )
+        lo = np.searchsorted(sorted_times, start_time, side='left')
+        hi = np.searchsorted(sorted_times, end_time, side='right')
         
-        return filtered
+        return sorted_data[lo:hi]
     
     def _calculate_distance(self, lat1: float, lon1: float, 
                           lat2: float, lon2: float) -> float:
         """Calculate distance between two points in kilometers."""
-        from math import radians, cos, sin, asin, sqrt
-        
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+        lat1 = radians(lat1)
+        lat2 = radians(lat2)
         
         # Haversine formula
         dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        dlon = radians(lon2 - lon1)
         a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * asin(sqrt(a))
-        r = 6371  # Earth radius in kilometers
-        
-        return c * r
+        return 2 * asin(sqrt(a)) * EARTH_RADIUS_KM
     
-    def _calculate_planetary_alignment(self, positions: Dict) -> Dict:
-        """Calculate planetary alignment metrics."""
-        if len(positions) < 2:
-            return {}
+    def _calculate_distance_vec(self, lat1, lon1, lat2, lon2) -> np.ndarray:
+        """
+        Calculate distances in kilometers between broadcastable arrays of points.
         
-        # Calculate angular separations
-        separations = []
-        planet_names = list(positions.keys())
+        Array counterpart of `_calculate_distance`; the arctan2 form stays
+        accurate for nearly antipodal points where arcsin saturates.
+        """
+        lat1, lon1, lat2, lon2 = (np.radians(np.asarray(x, dtype=np.float64))
+                                  for x in (lat1, lon1, lat2, lon2))
         
-        for i in range(len(planet_names)):
-            for j in range(i + 1, len(planet_names)):
-                pos1 = positions[planet_names[i]]
-                pos2 = positions[planet_names[j]]
-                
-                if pos1.get('ra_deg') is not None and pos2.get('ra_deg') is not None:
-                    # Angular separation calculation
-                    ra1, dec1 = np.radians(pos1['ra_deg']), np.radians(pos1['dec_deg'])
-                    ra2, dec2 = np.radians(pos2['ra_deg']), np.radians(pos2['dec_deg'])
-                    
-                    cos_sep = (np.sin(dec1) * np.sin(dec2) + 
-                              np.cos(dec1) * np.cos(dec2) * np.cos(ra1 - ra2))
-                    separation = np.degrees(np.arccos(np.clip(cos_sep, -1, 1)))
-                    separations.append(separation)
-        
-        if separations:
-            return {
-                'mean_separation_deg': np.mean(separations),
-                'min_separation_deg': np.min(separations),
-                'max_separation_deg': np.max(separations),
-                'alignment_score': 1.0 / (1.0 + np.mean(separations)),
-                'tight_alignment': np.min(separations) < 30.0
-            }
+        a = (np.sin((lat2 - lat1) / 2) ** 2
+             + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        
+        return c * EARTH_RADIUS_KM
+    
+    def _calculate_planetary_alignment(self, positions: PlanetaryPositions) -> Dict:
+        """Calculate planetary alignment metrics.
+
+        Results are memoized in the shared _alignment_cache as read-only
+        mappings; each caller gets its own copy.
+        """
+        if len(positions.names) < 2:
+            return {}
         
-        return {}
+        key = hashkey(tuple(positions.names), positions.ra_deg.tobytes(),
+                      positions.dec_deg.tobytes())
+        metrics = self._alignment_cache.get(key)
+        if metrics is None:
+            separations = _pairwise_sep_upper(np.radians(positions.ra_deg),
+                                              np.radians(positions.dec_deg))
+            
+            mean_separation = separations.mean()
+            min_separation = separations.min()
+            metrics = self._alignment_cache[key] = MappingProxyType({
+                'mean_separation_deg': mean_separation,
+                'min_separation_deg': min_separation,
+                'max_separation_deg': separations.max(),
+                'alignment_score': 1.0 / (1.0 + mean_separation),
+                'tight_alignment': min_separation < TIGHT_ALIGNMENT_DEG
+            })
+        
+        return dict(metrics)
     
     async def generate_real_data_report(self, analysis_results: Dict) -> str:
         """Generate comprehensive report from real data analysis."""
-        report = []
-        report.append("=" * 80)
-        report.append("REAL MULTI-SOURCE COSMIC CORRELATION ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append(f"Event: {analysis_results['event_name']}")
-        report.append(f"Event Time: {analysis_results['event_time']}")
-        report.append(f"Analysis Time: {analysis_results['analysis_timestamp']}")
-        report.append("")
-        
-        # Data Sources Summary
-        report.append("REAL DATA SOURCES ANALYZED:")
-        for source in analysis_results['data_sources_used']:
-            report.append(f"  ✓ {source.replace('_', ' ').title()}")
-        report.append("")
+        buf = io.StringIO()
+        line = partial(print, file=buf)
+        line("=" * 80)
+        line("REAL MULTI-SOURCE COSMIC CORRELATION ANALYSIS REPORT")
+        line("=" * 80)
+        line(f"Event: {analysis_results['event_name']}")
+        line(f"Event Time: {analysis_results['event_time']}")
+        line(f"Analysis Time: {analysis_results['analysis_timestamp']}")
+        line()
+        
+        # Data Sources Summary; the same source sets recur across events
+        line(_sources_block(tuple(analysis_results['data_sources_used'])))
+        line()
         
         # Data Details
         if 'gw_detectors' in analysis_results:
-            report.append(f"Gravitational Wave Detectors: {', '.join(analysis_results['gw_detectors'])}")
+            line(f"Gravitational Wave Detectors: {', '.join(analysis_results['gw_detectors'])}")
             for det, samples in analysis_results.get('gw_samples', {}).items():
-                report.append(f"  {det}: {samples:,} samples")
+                line(f"  {det}: {samples:,} samples")
         
         if 'seismic_events' in analysis_results:
-            report.append(f"Seismic Events Found: {analysis_results['seismic_events']}")
+            line(f"Seismic Events Found: {analysis_results['seismic_events']}")
         
         if 'tide_stations' in analysis_results:
-            report.append(f"Tide Stations: {', '.join(analysis_results['tide_stations'])}")
+            line(f"Tide Stations: {', '.join(analysis_results['tide_stations'])}")
         
         if 'space_weather_types' in analysis_results:
-            report.append(f"Space Weather Data: {', '.join(analysis_results['space_weather_types'])}")
+            line(f"Space Weather Data: {', '.join(analysis_results['space_weather_types'])}")
         
         if 'cosmic_ray_stations' in analysis_results:
-            report.append(f"Cosmic Ray Stations: {', '.join(analysis_results['cosmic_ray_stations'])}")
+            line(f"Cosmic Ray Stations: {', '.join(analysis_results['cosmic_ray_stations'])}")
         
         if 'planetary_bodies' in analysis_results:
-            report.append(f"Planetary Bodies: {', '.join(analysis_results['planetary_bodies'])}")
+            line(f"Planetary Bodies: {', '.join(analysis_results['planetary_bodies'])}")
         
-        report.append("")
+        line()
         
         # Correlations Found
         correlations = analysis_results.get('correlations_found', [])
         if correlations:
-            report.append(f"CORRELATIONS DETECTED ({len(correlations)}):")
+            line(f"CORRELATIONS DETECTED ({len(correlations)}):")
             for i, corr in enumerate(correlations, 1):
-                report.append(f"{i}. {corr['type'].replace('_', ' ').title()}")
-                report.append(f"   Confidence: {corr.get('confidence', 0):.3f}")
+                line(f"{i}. {TITLE[corr['type']]}")
+                line(f"   Confidence: {corr.get('confidence', 0):.3f}")
                 if 'time_difference_seconds' in corr:
-                    report.append(f"   Time Difference: {corr['time_difference_seconds']:.1f} seconds")
+                    line(f"   Time Difference: {corr['time_difference_seconds']:.1f} seconds")
                 if 'distance_km' in corr:
-                    report.append(f"   Distance: {corr['distance_km']:.1f} km")
-                report.append("")
+                    line(f"   Distance: {corr['distance_km']:.1f} km")
+                if 'lag_seconds' in corr:
+                    line(f"   Lag: {corr['lag_seconds'] * 1000:.1f} ms")
+                line()
         else:
-            report.append("No significant correlations detected in this analysis window.")
-            report.append("")
+            line("No significant correlations detected in this analysis window.")
+            line()
         
         # Significance Scores
         significance = analysis_results.get('significance_scores', {})
         if significance:
-            report.append("SIGNIFICANCE ASSESSMENT:")
+            line("SIGNIFICANCE ASSESSMENT:")
             for metric, score in significance.items():
-                report.append(f"  {metric.replace('_', ' ').title()}: {score:.3f}")
-            report.append("")
+                line(f"  {TITLE[metric]}: {score:.3f}")
+            line()
         
         # Insights
         insights = analysis_results.get('insights', [])
         if insights:
-            report.append("KEY INSIGHTS:")
+            line("KEY INSIGHTS:")
             for insight in insights:
-                report.append(f"  • {insight}")
-            report.append("")
+                line(f"  • {insight}")
+            line()
         
         # Scientific Interpretation
-        report.append("SCIENTIFIC INTERPRETATION:")
+        line("SCIENTIFIC INTERPRETATION:")
         
         if len(analysis_results['data_sources_used']) >= 4:
-            report.append("  ✓ Multi-source analysis provides robust correlation detection")
+            line("  ✓ Multi-source analysis provides robust correlation detection")
         
         if any(c['type'] == 'multi_source_timing' for c in correlations):
-            report.append("  ✓ Temporal correlations across multiple data sources detected")
-            report.append("    This suggests possible common underlying phenomena")
+            line("  ✓ Temporal correlations across multiple data sources detected")
+            line("    This suggests possible common underlying phenomena")
         
         if any('gw_' in c['type'] for c in correlations):
-            report.append("  ✓ Gravitational wave correlations with terrestrial phenomena")
-            report.append("    May indicate local environmental sensitivity to spacetime disturbances")
+            line("  ✓ Gravitational wave correlations with terrestrial phenomena")
+            line("    May indicate local environmental sensitivity to spacetime disturbances")
         
         overall_sig = significance.get('overall', 0)
         if overall_sig > 0.7:
-            report.append("  🔴 HIGH SIGNIFICANCE: Strong evidence for multi-source correlations")
+            line("  🔴 HIGH SIGNIFICANCE: Strong evidence for multi-source correlations")
         elif overall_sig > 0.5:
-            report.append("  🟡 MODERATE SIGNIFICANCE: Some correlations detected")
+            line("  🟡 MODERATE SIGNIFICANCE: Some correlations detected")
         else:
-            report.append("  🟢 BASELINE: Normal background correlations observed")
+            line("  🟢 BASELINE: Normal background correlations observed")
         
-        report.append("")
-        report.append("NEXT STEPS:")
-        report.append("  1. Extend analysis to longer time windows")
-        report.append("  2. Include additional real-time data sources")
-        report.append("  3. Apply machine learning for pattern detection")
-        report.append("  4. Correlate with astronomical events database")
+        line()
+        line("NEXT STEPS:")
+        line("  1. Extend analysis to longer time windows")
+        line("  2. Include additional real-time data sources")
+        line("  3. Apply machine learning for pattern detection")
+        line("  4. Correlate with astronomical events database")
         
-        report.append("")
-        report.append("=" * 80)
+        line()
+        buf.write("=" * 80)
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     async def run_real_analysis_session(self, event_name: str = 'GW170817'):
         """Run comprehensive real data analysis session."""
-        print("""
-        ╔════════════════════════════════════════════════════════════════╗
-        ║           REAL MULTI-SOURCE COSMIC CORRELATION SYSTEM          ║
-        ║                                                                ║
-        ║    Analyzing REAL data from multiple scientific sources        ║
-        ╚════════════════════════════════════════════════════════════════╝
-        """)
+        print(SESSION_BANNER)
         
         try:
             # Initialize HTTP session
@@ -945,20 +1529,30 @@ class RealMultiSourceAnalyzer:
             # Generate and display report
             report = await self.generate_real_data_report(analysis_results)
             
-            # Save results
+            # Save results; both files share one timestamp so their names match
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            output_dir = Path('.')
+            results_file = output_dir / f"real_analysis_{event_name}_{timestamp}.json"
+            report_file = output_dir / f"real_analysis_report_{event_name}_{timestamp}.txt"
             
             # Save detailed results
-            results_file = f"real_analysis_{event_name}_{timestamp}.json"
-            with open(results_file, 'w', encoding='utf-8') as f:
+            if orjson is not None:
+                # orjson serializes numpy scalars and arrays natively
+                results_file.write_bytes(orjson.dumps(
+                    analysis_results,
+                    default=self._orjson_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            else:
                 # Convert numpy arrays to lists for JSON serialization
                 json_safe_results = self._make_json_safe(analysis_results)
-                json.dump(json_safe_results, f, indent=2, default=str, ensure_ascii=False)
+                results_file.write_text(
+                    json.dumps(json_safe_results, indent=2, default=str, ensure_ascii=False),
+                    encoding='utf-8'
+                )
             
             # Save report
-            report_file = f"real_analysis_report_{event_name}_{timestamp}.txt"
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+            report_file.write_text(report, encoding='utf-8')
             
             # Display results
             print(report)
@@ -976,20 +1570,35 @@ class RealMultiSourceAnalyzer:
             # Cleanup
             await self.cleanup_session()
     
-    def _make_json_safe(self, obj):
-        """Convert numpy arrays and other non-JSON types to JSON-safe formats."""
-        if isinstance(obj, dict):
-            return {k: self._make_json_safe(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_json_safe(v) for v in obj]
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, (np.integer, np.floating)):
-            return float(obj)
-        elif hasattr(obj, 'value'):  # Handle astropy quantities
+    @staticmethod
+    def _orjson_default(obj):
+        """Fallback for types orjson can't serialize natively."""
+        if hasattr(obj, 'value'):  # Handle astropy quantities
             return float(obj.value)
-        else:
-            return obj
+        return str(obj)
+    
+    def _make_json_safe(self, obj):
+        """Convert numpy arrays and other non-JSON types to JSON-safe formats.
+
+        Dicts and lists are converted in place, walking them with an explicit
+        stack instead of rebuilding every container; the converted object is
+        returned.
+        """
+        if not isinstance(obj, (dict, list)):
+            return _json_safe_value(obj)
+        
+        stack = [obj]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                else:
+                    safe = _json_safe_value(value)
+                    if safe is not value:
+                        container[key] = safe
+        return obj
 
 
 async def main():